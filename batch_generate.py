@@ -0,0 +1,145 @@
+"""
+Headless batch generation of puzzles for the puzzle bank (no Kivy import).
+
+Puzzles are generated on a process pool and streamed, as chunks complete,
+to one record file per difficulty (<out_dir>/<difficulty>.rec, fixed-width
+records from sudoku_core.bank.encode_record). Re-running the same command resumes
+from the records already on disk, and with --seed the output is reproducible.
+With --bank the record files are then assembled into a bank file, and
+--audit validates every record of that bank (sudoku_core.validator, needs NumPy).
+
+Usage:
+  python batch_generate.py --count 100000 --difficulty easy medium hard god \\
+      --out-dir batches --bank data/puzzles.bank
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from sudoku_core.bank import encode_record, record_size, write_bank
+from sudoku_core.generator import SudokuGenerator
+
+DIFFICULTIES = ["easy", "medium", "hard", "god"]
+
+
+def generate_chunk(difficulty, start, count, seed=None):
+    """
+    Worker: generates puzzles start .. start+count-1 and returns them as
+    concatenated records. With a seed, puzzle i is always the one for the
+    seed "<seed>:<difficulty>:<i>".
+    """
+    generator = SudokuGenerator()
+    records = []
+    for i in range(start, start + count):
+        puzzle_seed = None if seed is None else f"{seed}:{difficulty}:{i}"
+        puzzle, solution = generator.generate_puzzle_with_solution(difficulty, puzzle_seed)
+        records.append(encode_record(puzzle, solution))
+    return b"".join(records)
+
+
+def existing_records(path):
+    """
+    Number of complete records in 'path'; a partial trailing record left by
+    an interrupted run is truncated.
+    """
+    if not os.path.exists(path):
+        return 0
+    size = record_size()
+    records, partial = divmod(os.path.getsize(path), size)
+    if partial:
+        with open(path, "r+b") as f:
+            f.truncate(records * size)
+    return records
+
+
+def generate_records(path, difficulty, count, executor, workers, chunk, seed=None):
+    done = existing_records(path)
+    if done >= count:
+        print(f"{difficulty}: {done} records already in {path}", file=sys.stderr)
+        return
+    print(f"{difficulty}: resuming at {done}/{count}" if done else f"{difficulty}: generating {count}",
+          file=sys.stderr)
+
+    start = time.perf_counter()
+    made = 0
+    queued = done
+    pending = {}
+    results = {}
+    with open(path, "ab") as out:
+        while done < count:
+            # Keep a bounded number of chunks in flight
+            while queued < count and len(pending) < 2 * workers:
+                size = min(chunk, count - queued)
+                pending[executor.submit(generate_chunk, difficulty, queued, size, seed)] = queued
+                queued += size
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                results[pending.pop(future)] = future.result()
+            # Chunks are written in index order so the file stays a valid prefix
+            while done in results:
+                data = results.pop(done)
+                out.write(data)
+                out.flush()
+                os.fsync(out.fileno())  # The file itself is the resume checkpoint
+                new = len(data) // record_size()
+                done += new
+                made += new
+            elapsed = time.perf_counter() - start
+            rate = made / elapsed if elapsed else 0.0
+            print(f"\r{difficulty}: {done}/{count}  {rate:.1f} puzzles/s  "
+                  f"{rate / workers:.1f} puzzles/s/core", end="", file=sys.stderr)
+    print(file=sys.stderr)
+
+
+def read_records(path):
+    size = record_size()
+    with open(path, "rb") as f:
+        while True:
+            record = f.read(size)
+            if len(record) < size:
+                return
+            yield record
+
+
+def audit_bank(path):
+    from sudoku_core.bank import PuzzleBank
+    from sudoku_core.validator import VALID, validate_bank
+
+    with PuzzleBank(path) as bank:
+        for difficulty in bank.sections:
+            flags = validate_bank(bank, difficulty)
+            bad = int((flags != VALID).sum())
+            print(f"{difficulty}: {len(flags) - bad}/{len(flags)} records valid", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate puzzles in bulk for the puzzle bank.")
+    parser.add_argument("--count", type=int, required=True, help="puzzles per difficulty")
+    parser.add_argument("--difficulty", nargs="+", default=DIFFICULTIES, choices=DIFFICULTIES)
+    parser.add_argument("--out-dir", default="batches", help="directory for the .rec files")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=100, help="puzzles per worker task")
+    parser.add_argument("--bank", help="assemble the record files into this bank file")
+    parser.add_argument("--audit", action="store_true",
+                        help="validate every record of the bank once written (needs NumPy)")
+    parser.add_argument("--seed", help="make the output reproducible (puzzle i uses <seed>:<difficulty>:<i>)")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    paths = {d: os.path.join(args.out_dir, f"{d}.rec") for d in args.difficulty}
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for difficulty, path in paths.items():
+            generate_records(path, difficulty, args.count, executor, args.workers, args.chunk,
+                             args.seed)
+
+    if args.bank:
+        write_bank(args.bank, {d: read_records(path) for d, path in paths.items()})
+        print(f"wrote {args.bank}", file=sys.stderr)
+        if args.audit:
+            audit_bank(args.bank)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Generation time per board size (4x4, 9x9, 16x16, 25x25): full solution
+grids and puzzles for each difficulty, with the median and worst time over
+seeded runs.
+
+Usage: python benchmarks/bench_sizes.py [runs] [sizes...]
+  e.g. python benchmarks/bench_sizes.py 5 4 9 16
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sudoku_core.generator import DIFFICULTY_HOLES, SudokuGenerator
+
+DIFFICULTIES = ["easy", "medium", "hard", "god"]
+
+
+def time_runs(make, runs):
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        make(i)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), max(times)
+
+
+def main(runs=5, sizes=(4, 9, 16, 25)):
+    print(f"{'size':<6} {'case':<8} {'holes':>6} {'median (ms)':>12} {'max (ms)':>12}")
+    for size in sizes:
+        generator = SudokuGenerator(size)
+        median, worst = time_runs(lambda i: generator.generate_full_solution(seed=f"full:{i}"), runs)
+        print(f"{size:<6} {'full':<8} {0:>6} {median * 1000:>12.2f} {worst * 1000:>12.2f}")
+        for difficulty in DIFFICULTIES:
+            median, worst = time_runs(
+                lambda i: generator.generate_puzzle(difficulty, seed=f"{difficulty}:{i}"), runs)
+            holes = DIFFICULTY_HOLES[size][difficulty]
+            print(f"{size:<6} {difficulty:<8} {holes:>6} {median * 1000:>12.2f} {worst * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    sizes = [int(size) for size in sys.argv[2:]] or (4, 9, 16, 25)
+    main(runs, sizes)
@@ -0,0 +1,208 @@
+"""
+Benchmark suite for the generation, solving and validation hot paths
+(headless, no Kivy import). Every case runs on seeded inputs, so two runs
+measure the same work:
+
+  full_solution        generate_full_solution
+  transformed_solution generate_transformed_solution from a fixed base grid
+  dig_<difficulty>     remove_cells_with_unique_check on seeded full grids
+  uniqueness_hard      solve_sudoku_check_uniqueness on a corpus of seeded hard puzzles
+  valid_move_puzzle    SudokuPuzzle.is_valid_move (mask lookup), per call
+  valid_move_scan      scan_valid_move (the old row/column/box scan, as a baseline), per call
+  validate_batch       sudoku_core.validator.validate_batch per board (skipped without NumPy)
+
+Each case reports p50/p95/p99 latency, throughput and the peak memory of
+one extra traced run (tracemalloc). Results are written as JSON; with
+--baseline they are compared against an earlier result file and cases
+whose p50 got slower by more than --threshold are flagged.
+
+Usage:
+  python benchmarks/bench_suite.py --out bench.json
+  python benchmarks/bench_suite.py --baseline bench.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sudoku_core.generator import SudokuGenerator
+from sudoku_core.puzzle import SudokuPuzzle
+
+DIFFICULTIES = ["easy", "medium", "hard", "god"]
+MOVE_CALLS = 1000  # is_valid_move calls timed together per sample
+
+
+def percentile(values, p):
+    """
+    Nearest-rank percentile of a sorted list.
+    """
+    rank = max(1, -(-len(values) * p // 100))
+    return values[int(rank) - 1]
+
+
+def scan_valid_move(board, row, col, value):
+    """
+    Row/column/box scan of a 9x9 list of rows, the move check the puzzle
+    masks replaced. Kept here only as a baseline.
+    """
+    if value in board[row]:
+        return False
+    if any(board[r][col] == value for r in range(9)):
+        return False
+    sub_row, sub_col = row // 3 * 3, col // 3 * 3
+    return all(board[sub_row + i][sub_col + j] != value for i in range(3) for j in range(3))
+
+
+def measure(run, samples, per_sample=1):
+    """
+    Times run(i) for i in range(samples) and returns the latency stats (in
+    microseconds per operation, 'per_sample' operations per run) and the
+    peak traced memory of one more run.
+    """
+    times = []
+    for i in range(samples):
+        start = time.perf_counter()
+        run(i)
+        times.append((time.perf_counter() - start) / per_sample)
+    tracemalloc.start()
+    run(0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    times.sort()
+    total = sum(times)
+    return {
+        "samples": samples,
+        "p50_us": percentile(times, 50) * 1e6,
+        "p95_us": percentile(times, 95) * 1e6,
+        "p99_us": percentile(times, 99) * 1e6,
+        "mean_us": total / samples * 1e6,
+        "throughput_per_s": samples / total if total else 0.0,
+        "peak_kib": peak / 1024,
+    }
+
+
+def build_cases(runs):
+    """
+    Returns [(name, run, samples, per_sample)]. All inputs are generated
+    here from fixed seeds, outside the timed runs.
+    """
+    generator = SudokuGenerator(seed=0)
+    cases = [("full_solution", lambda i: generator.generate_full_solution(seed=f"full:{i}"), runs, 1)]
+
+    base = generator.generate_full_solution(seed="base")
+    cases.append(("transformed_solution",
+                  lambda i: generator.generate_transformed_solution(seed=f"transform:{i}", base=base),
+                  runs, 1))
+
+    grids = [generator.generate_full_solution(seed=f"grid:{i}") for i in range(runs)]
+    for difficulty in DIFFICULTIES:
+        def dig(i, difficulty=difficulty):
+            generator.remove_cells_with_unique_check(grids[i].copy(), difficulty,
+                                                     seed=f"dig:{i}", time_limit=None)
+        cases.append((f"dig_{difficulty}", dig, runs, 1))
+
+    corpus = [generator.generate_puzzle("hard", seed=f"corpus:{i}") for i in range(runs)]
+    cases.append(("uniqueness_hard", lambda i: generator.solve_sudoku_check_uniqueness(corpus[i]),
+                  runs, 1))
+
+    rng = random.Random("moves")
+    moves = [(rng.randrange(9), rng.randrange(9), rng.randint(1, 9)) for _ in range(MOVE_CALLS)]
+    puzzle = SudokuPuzzle(corpus[0])
+    board = puzzle.board
+    rows = [row[:] for row in corpus[0]]
+
+    def puzzle_moves(i):
+        for row, col, value in moves:
+            puzzle.is_valid_move(board, row, col, value)
+
+    def scan_moves(i):
+        for row, col, value in moves:
+            scan_valid_move(rows, row, col, value)
+
+    cases.append(("valid_move_puzzle", puzzle_moves, runs, MOVE_CALLS))
+    cases.append(("valid_move_scan", scan_moves, runs, MOVE_CALLS))
+
+    try:
+        import numpy as np
+        from sudoku_core.validator import validate_batch
+    except ImportError:
+        print("numpy not installed: skipping validate_batch", file=sys.stderr)
+    else:
+        pairs = [generator.generate_puzzle_with_solution("easy", seed=f"batch:{i}") for i in range(100)]
+        puzzles = np.array([pair[0] for pair in pairs] * 100, dtype=np.uint8)
+        solutions = np.array([pair[1] for pair in pairs] * 100, dtype=np.uint8)
+        cases.append(("validate_batch", lambda i: validate_batch(puzzles, solutions),
+                      max(5, runs // 10), len(puzzles)))
+    return cases
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the names of cases whose p50 is more than 'threshold' (a
+    fraction) slower than in 'baseline'.
+    """
+    regressions = []
+    print(f"\n{'case':<22} {'baseline p50':>13} {'p50':>10} {'change':>8}")
+    for name, result in results.items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        change = result["p50_us"] / before["p50_us"] - 1 if before["p50_us"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<22} {before['p50_us']:>13.2f} {result['p50_us']:>10.2f} {change:>+7.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark generation, solving and validation.")
+    parser.add_argument("--runs", type=int, default=50, help="samples per case")
+    parser.add_argument("--only", nargs="+", help="run only cases whose name starts with one of these")
+    parser.add_argument("--out", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this earlier JSON result file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="p50 slowdown (fraction) flagged as a regression")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'case':<22} {'p50 (µs)':>10} {'p95 (µs)':>10} {'p99 (µs)':>10} {'ops/s':>12} {'peak KiB':>9}")
+    for name, run, samples, per_sample in build_cases(args.runs):
+        if args.only and not name.startswith(tuple(args.only)):
+            continue
+        result = results[name] = measure(run, samples, per_sample)
+        print(f"{name:<22} {result['p50_us']:>10.2f} {result['p95_us']:>10.2f} {result['p99_us']:>10.2f} "
+              f"{result['throughput_per_s']:>12.1f} {result['peak_kib']:>9.1f}")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "runs": args.runs,
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+Compares counting solutions (solve_sudoku_check_uniqueness) with the
+dual-order fast path (check_uniqueness_dual_order) on generated puzzles.
+Each difficulty is measured on unique puzzles and on the same puzzles with
+one extra clue removed (mostly non-unique). Puzzles and removed clues are
+seeded, so every run checks the same boards.
+
+Usage: python benchmarks/bench_uniqueness.py [puzzles_per_difficulty]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sudoku_core.generator import SudokuGenerator
+
+DIFFICULTIES = ["easy", "medium", "hard", "god"]
+
+
+def time_checks(check, boards):
+    start = time.perf_counter()
+    results = [check(board) for board in boards]
+    return (time.perf_counter() - start) / len(boards), results
+
+
+def main(count=50):
+    rng = random.Random(1234)  # Picks the extra clue to remove
+    generator = SudokuGenerator()
+    print(f"{'difficulty':<10} {'case':<10} {'count (ms)':>12} {'dual (ms)':>12} {'speedup':>8}")
+    for difficulty in DIFFICULTIES:
+        unique = [generator.generate_puzzle(difficulty, seed=f"{difficulty}:{i}") for i in range(count)]
+        loose = []
+        for board in unique:
+            board = [row[:] for row in board]
+            r, c = rng.choice([(r, c) for r in range(9) for c in range(9) if board[r][c]])
+            board[r][c] = 0
+            loose.append(board)
+
+        for case, boards in (("unique", unique), ("loose", loose)):
+            count_time, expected = time_checks(generator.solve_sudoku_check_uniqueness, boards)
+            dual_time, results = time_checks(generator.check_uniqueness_dual_order, boards)
+            assert results == expected, "dual-order check disagrees with solution counting"
+            print(f"{difficulty:<10} {case:<10} {count_time * 1000:>12.3f} "
+                  f"{dual_time * 1000:>12.3f} {count_time / dual_time:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
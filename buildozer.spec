@@ -13,7 +13,7 @@ package.domain = org.jorge.sudoku
 source.dir = .
 
 # (list) Source files to include (let empty to include all the files)
-source.include_exts = py,png,jpg,kv,atlas
+source.include_exts = py,png,jpg,kv,atlas,bank
 
 # (list) List of inclusions using pattern matching
 # Incluye toda la carpeta data (para tus imágenes)
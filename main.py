@@ -1,3 +1,6 @@
+from startup_timeline import StartupTimeline
+startup = StartupTimeline()  # Starts the cold-start clock before any Kivy import
+
 from kivy.core.window import Window
 from kivy.clock import Clock
 from kivy.uix.label import Label
@@ -15,7 +18,9 @@ from kivymd.uix.screen import MDScreen
 from kivymd.uix.button import MDButton, MDButtonText
 from kivy.utils import platform
 from kivy.storage.jsonstore import JsonStore
+from kivy.logger import Logger
 import os
+startup.mark("kivy_imported")
 
 if platform == "android":
     from android.storage import app_storage_path
@@ -28,10 +33,18 @@ else:
 store = JsonStore(records_path)
 
 
-from sudoku_generator import SudokuGenerator
-from sudoku_puzzle import SudokuPuzzle
+from sudoku_core.bank import PuzzleBank
+from sudoku_core.pool import PuzzlePool
 from sudoku_widgets import SudokuGrid, NumberPad
 
+# Pre-generated puzzles shipped with the app (built offline), if present
+bank_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "puzzles.bank")
+puzzle_bank = PuzzleBank(bank_path) if os.path.exists(bank_path) else None
+
+# Puzzles are generated ahead of time on a worker thread (started after the first frame)
+puzzle_pool = PuzzlePool(pause=0.05, bank=puzzle_bank)
+startup.mark("imports")
+
 from kivy.uix.scatter import Scatter
 
 class ZoomScatter(Scatter):
@@ -73,6 +86,8 @@ class SplashScreen(MDScreen):
             self.manager.current = "menu"
             return False
         self.image.source = self.frames[self.frame_index]
+        # Use the time between animation frames to build the next screen
+        self.manager.build_next()
         self.schedule_next_frame()
         return True
 
@@ -102,21 +117,9 @@ class GameScreen(MDScreen):
         """
         self.selected_difficulty = difficulty
         screen_width, screen_height = Window.size
-        generator = SudokuGenerator()
-        board = generator.generate_puzzle(difficulty)
-        puzzle = SudokuPuzzle(board)
-                # Luego de: puzzle = SudokuPuzzle(board)
+        puzzle = puzzle_pool.get(difficulty)  # SudokuPuzzle con su solución
         self.sudoku_puzzle = puzzle  # Guarda el puzzle en un atributo para usar en validaciones
 
-        # Definir la cuenta inicial según la dificultad
-        if difficulty == "easy":
-            self.remaining_zeros_count = 40
-        elif difficulty == "medium":
-            self.remaining_zeros_count = 45
-        elif difficulty == "hard":
-            self.remaining_zeros_count = 50
-        elif difficulty == "god":
-            self.remaining_zeros_count = 55
 
 
         # Sudoku Grid (centrado)
@@ -254,16 +257,15 @@ class GameScreen(MDScreen):
         """
         # Si la celda estaba vacía (0) y ahora se asigna un número distinto de 0
         if self.sudoku_puzzle.board[row][col] == 0 and new_value != 0:
+            # Chequeo O(1) contra las máscaras del propio puzzle
             if self.sudoku_puzzle.is_valid_move(self.sudoku_puzzle.board, row, col, new_value):
-                self.remaining_zeros_count -= 1
-                self.sudoku_puzzle.board[row][col] = new_value
+                self.sudoku_puzzle.set_cell(row, col, new_value)
         # Si la celda tenía un valor distinto de 0 y ahora se pasa a 0 (vacío)
         elif self.sudoku_puzzle.board[row][col] != 0 and new_value == 0:
-            self.remaining_zeros_count += 1
-            self.sudoku_puzzle.board[row][col] = new_value
-    
-        # Verificar si ya se llenaron todas las celdas
-        if self.remaining_zeros_count == 0:
+            self.sudoku_puzzle.clear_cell(row, col)
+
+        # Verificar contra la solución guardada si el Sudoku está resuelto
+        if self.sudoku_puzzle.is_solved():
             # Detener el timer
             if self.clock_event:
                 Clock.unschedule(self.clock_event)
@@ -318,6 +320,7 @@ class MenuScreen(MDScreen):
     def create_buttons(self):
         # Reset container
         self.layout.clear_widgets()
+        self.built_size = tuple(Window.size)
 
         # Local imports for DPI-aware sizing
         from kivy.metrics import sp
@@ -461,7 +464,15 @@ class MenuScreen(MDScreen):
         self.manager.current = "options"
 
     def on_pre_enter(self):
-        self.create_buttons()
+        # The cards are built with the screen; rebuild only if the window changed since
+        if not self.layout.children or self.built_size != tuple(Window.size):
+            self.create_buttons()
+
+    def on_enter(self):
+        if "menu_shown" not in startup.marks:
+            startup.mark("menu_shown")
+            Logger.info(f"Startup: {startup.summary()}")
+            startup.save()
 
 
 ############-----------#############
@@ -606,9 +617,46 @@ class WinningScreen(MDScreen):
 
 
 
+# Screen manager that builds screens on first use instead of all in build().
+class LazyScreenManager(ScreenManager):
+    """
+    Screens registered with add_lazy_screen are built the first time they
+    are shown or fetched with get_screen, or earlier with build_next (one
+    screen per call, in registration order), e.g. during the splash animation.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.factories = {}  # name -> screen class, for screens not built yet
+
+    def add_lazy_screen(self, name, factory):
+        self.factories[name] = factory
+
+    def build_screen(self, name):
+        screen = self.factories.pop(name)(name=name)
+        self.add_widget(screen)
+        startup.mark(f"screen_{name}")
+        return screen
+
+    def build_next(self):
+        """
+        Builds the next pending screen. Returns False when all are built.
+        """
+        if not self.factories:
+            return False
+        self.build_screen(next(iter(self.factories)))
+        return True
+
+    def get_screen(self, name):
+        # ScreenManager looks the new screen up here when 'current' changes
+        if name in self.factories:
+            return self.build_screen(name)
+        return super().get_screen(name)
+
+
 from kivymd.app import MDApp
 class SudokuApp(MDApp):
     def build(self):
+        startup.mark("build")
         screen_width, screen_height = Window.system_size  # Obtiene la resolución del monitor
         aspect_ratio = 9/19.5  # Relación de aspecto típica de un celular
 
@@ -619,15 +667,27 @@ class SudokuApp(MDApp):
             Window.size = (screen_width * 0.9, screen_width / aspect_ratio)  # Basado en ancho
 
 
-        sm = ScreenManager()
+        # Only the splash screen is built before the first frame
+        sm = LazyScreenManager()
         sm.add_widget(SplashScreen(name="splash"))
-        sm.add_widget(MenuScreen(name="menu"))
-        sm.add_widget(GameScreen(name="game"))
-        sm.add_widget(AppOptions(name="options"))
+        sm.add_lazy_screen("menu", MenuScreen)
+        sm.add_lazy_screen("game", GameScreen)
+        sm.add_lazy_screen("options", AppOptions)
         sm.current = "splash"
 
+        Window.bind(on_flip=self.on_first_frame)
+        startup.mark("build_done")
         return sm
 
+    def on_first_frame(self, *args):
+        Window.unbind(on_flip=self.on_first_frame)
+        startup.mark("first_frame")
+        # Start generating puzzles only once the first frame is on screen
+        puzzle_pool.start()
+
+    def on_stop(self):
+        puzzle_pool.stop()
+
 
 if __name__ == '__main__':
     SudokuApp().run()
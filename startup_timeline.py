@@ -0,0 +1,35 @@
+import os
+import time
+
+
+# Cold-start timeline of the app (no Kivy import, so it can be loaded first).
+class StartupTimeline:
+    """
+    Records named timestamps, in seconds since the timeline was created
+    (the first line of main.py). Only the first occurrence of a mark is
+    kept, so marks can sit in code that runs more than once.
+    With the SUDOKU_STARTUP_LOG environment variable set to a path, save()
+    appends the timeline there as one JSON line per app start.
+    """
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = {"start": 0.0}
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.start
+
+    def elapsed(self, name):
+        return self.marks.get(name)
+
+    def summary(self):
+        return ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.marks.items())
+
+    def save(self, path=None):
+        path = path or os.environ.get("SUDOKU_STARTUP_LOG")
+        if not path:
+            return
+        import json
+
+        with open(path, "a") as f:
+            f.write(json.dumps({"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "marks": self.marks}) + "\n")
@@ -0,0 +1,43 @@
+"""
+Sudoku engine without any Kivy dependency: board, constraint model and
+solvers, generator, difficulty rating, puzzle model, puzzle bank and pool.
+
+Importing the package has no side effects (no files, no threads) and loads
+nothing up front: each name below is imported from its module on first
+use, so a worker that only needs the generator never loads the bank, the
+pool's threading or the NumPy validator.
+"""
+import importlib
+
+_EXPORTS = {
+    "Board": "board",
+    "BitmaskSolver": "solver",
+    "ConstraintGrid": "solver",
+    "DLXSolver": "dlx",
+    "DIFFICULTY_HOLES": "generator",
+    "GenerationStats": "generator",
+    "SudokuGenerator": "generator",
+    "SudokuPuzzle": "puzzle",
+    "Rating": "rating",
+    "SudokuRater": "rating",
+    "PuzzleBank": "bank",
+    "PuzzlePool": "pool",
+    # NumPy accelerators
+    "VALID": "validator",
+    "check_clues": "validator",
+    "check_grids": "validator",
+    "check_matches": "validator",
+    "validate_bank": "validator",
+    "validate_batch": "validator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'sudoku_core' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"sudoku_core.{module}"), name)
+    globals()[name] = value
+    return value
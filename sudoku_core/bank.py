@@ -0,0 +1,153 @@
+import mmap
+import random
+import struct
+
+# Puzzle bank file layout (all integers little-endian):
+#   header   magic, board size, bits per cell, record size, section count
+#   sections one entry per difficulty: name, offset of first record, record count
+#   records  fixed-width: solution packed 'bits' per cell, then a clue bitmask
+#            (bit i set when cell i is given in the puzzle)
+MAGIC = b"SDKBANK1"
+HEADER = struct.Struct("<8sBBHI")
+SECTION = struct.Struct("<16sQQ")
+
+
+def bits_per_cell(size):
+    return max(4, size.bit_length())
+
+
+def record_size(size=9):
+    """
+    Bytes used by one puzzle + solution record (52 for a 9x9 board).
+    """
+    cells = size * size
+    return (cells * bits_per_cell(size) + 7) // 8 + (cells + 7) // 8
+
+
+def encode_record(puzzle, solution, size=9):
+    """
+    Packs a puzzle and its solution (lists of rows) into a fixed-width record.
+    """
+    bits = bits_per_cell(size)
+    cells = size * size
+    packed = 0
+    clues = 0
+    for i in range(cells):
+        r, c = divmod(i, size)
+        packed |= solution[r][c] << (bits * i)
+        if puzzle[r][c]:
+            clues |= 1 << i
+    return (packed.to_bytes((cells * bits + 7) // 8, "little")
+            + clues.to_bytes((cells + 7) // 8, "little"))
+
+
+def decode_record(data, size=9):
+    """
+    Unpacks a record into (puzzle, solution) as lists of rows.
+    """
+    bits = bits_per_cell(size)
+    cells = size * size
+    split = (cells * bits + 7) // 8
+    packed = int.from_bytes(data[:split], "little")
+    clues = int.from_bytes(data[split:], "little")
+    digit = (1 << bits) - 1
+    solution = []
+    puzzle = []
+    for r in range(size):
+        solution_row = []
+        puzzle_row = []
+        for c in range(size):
+            i = r * size + c
+            num = packed >> (bits * i) & digit
+            solution_row.append(num)
+            puzzle_row.append(num if clues >> i & 1 else 0)
+        solution.append(solution_row)
+        puzzle.append(puzzle_row)
+    return puzzle, solution
+
+
+def write_bank(path, sections, size=9):
+    """
+    Writes a bank file. 'sections' maps a difficulty name to an iterable of
+    records, either already encoded (bytes) or (puzzle, solution) pairs.
+    Records are streamed, so the iterables may be generators.
+    """
+    rec_size = record_size(size)
+    names = list(sections)
+    table = []
+    with open(path, "wb") as f:
+        offset = HEADER.size + SECTION.size * len(names)
+        f.write(b"\0" * offset)
+        for name in names:
+            count = 0
+            for record in sections[name]:
+                if not isinstance(record, (bytes, bytearray)):
+                    record = encode_record(record[0], record[1], size)
+                if len(record) != rec_size:
+                    raise ValueError(f"record of {len(record)} bytes, expected {rec_size}")
+                f.write(record)
+                count += 1
+            table.append((name, offset, count))
+            offset += count * rec_size
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, size, bits_per_cell(size), rec_size, len(names)))
+        for name, start, count in table:
+            f.write(SECTION.pack(name.encode("ascii"), start, count))
+
+
+# Read-only view of a bank file; records are read straight from the mmap.
+class PuzzleBank:
+    """
+    Random access to pre-generated puzzles grouped by difficulty. Only the
+    header is parsed on open; get() slices and decodes a single record.
+    """
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size, bits, self.record_size, count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or bits != bits_per_cell(self.size) or self.record_size != record_size(self.size):
+            self.close()
+            raise ValueError(f"{path} is not a puzzle bank")
+        self.sections = {}
+        for i in range(count):
+            name, offset, records = SECTION.unpack_from(self.data, HEADER.size + i * SECTION.size)
+            self.sections[name.rstrip(b"\0").decode("ascii")] = (offset, records)
+
+    def count(self, difficulty):
+        return self.sections.get(difficulty, (0, 0))[1]
+
+    def get_record(self, difficulty, index):
+        """
+        Returns the raw record bytes of puzzle 'index' of 'difficulty'.
+        """
+        offset, records = self.sections[difficulty]
+        if not 0 <= index < records:
+            raise IndexError(f"{difficulty} puzzle {index} out of range")
+        start = offset + index * self.record_size
+        return self.data[start:start + self.record_size]
+
+    def get(self, difficulty, index):
+        """
+        Returns (puzzle, solution) for puzzle 'index' of 'difficulty'.
+        """
+        return decode_record(self.get_record(difficulty, index), self.size)
+
+    def random(self, difficulty, rng=random):
+        """
+        Returns a random (puzzle, solution) of 'difficulty', or None if there is none.
+        """
+        records = self.count(difficulty)
+        if not records:
+            return None
+        return self.get(difficulty, rng.randrange(records))
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,145 @@
+class BoardRow:
+    """
+    Live view of one row of a Board, so that board[row][col] reads and
+    writes the board like a list of rows does.
+    """
+    __slots__ = ("cells", "start", "size")
+
+    def __init__(self, cells, start, size):
+        self.cells = cells
+        self.start = start
+        self.size = size
+
+    def _index(self, col):
+        if col < 0:
+            col += self.size
+        if not 0 <= col < self.size:
+            raise IndexError("column index out of range")
+        return self.start + col
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return list(self.cells[self.start:self.start + self.size])[col]
+        return self.cells[self._index(col)]
+
+    def __setitem__(self, col, value):
+        self.cells[self._index(col)] = value
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.cells[self.start:self.start + self.size])
+
+    def __contains__(self, value):
+        return value in self.cells[self.start:self.start + self.size]
+
+    def count(self, value):
+        return self.cells.count(value, self.start, self.start + self.size)
+
+    def index(self, value):
+        return self.cells.index(value, self.start, self.start + self.size) - self.start
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+# Compact board: one byte per cell in a flat bytearray, row by row.
+class Board:
+    """
+    A size x size board (0 = empty cell) stored as a flat bytearray, so a
+    copy is a single buffer copy and the cells can be hashed as bytes.
+    Cell (row, col) is cells[row * size + col]. Indexing and iteration give
+    BoardRow views, so code written for a list of rows keeps working:
+    board[row][col] = value, value in board[row], row.count(0).
+    """
+    __slots__ = ("size", "box", "cells")
+
+    def __init__(self, rows=None, size=9):
+        if rows is not None:
+            size = len(rows)
+            self.cells = bytearray(num for row in rows for num in row)
+        else:
+            self.cells = bytearray(size * size)
+        self.size = size
+        self.box = int(round(size ** 0.5))
+
+    @classmethod
+    def from_cells(cls, cells):
+        """
+        Builds a board from a flat sequence of cells (row by row).
+        """
+        board = cls.__new__(cls)
+        board.cells = bytearray(cells)
+        board.size = int(round(len(board.cells) ** 0.5))
+        board.box = int(round(board.size ** 0.5))
+        return board
+
+    def copy(self):
+        board = Board.__new__(Board)
+        board.cells = self.cells[:]
+        board.size = self.size
+        board.box = self.box
+        return board
+
+    def to_rows(self):
+        """
+        Returns the board as a list of rows (lists of ints).
+        """
+        size = self.size
+        cells = self.cells
+        return [list(cells[r * size:(r + 1) * size]) for r in range(size)]
+
+    def get(self, row, col):
+        return self.cells[row * self.size + col]
+
+    def set(self, row, col, value):
+        self.cells[row * self.size + col] = value
+
+    def row(self, row):
+        return self.cells[row * self.size:(row + 1) * self.size]
+
+    def col(self, col):
+        return self.cells[col::self.size]
+
+    def box_cells(self, row, col):
+        """
+        Returns the cells of the box containing (row, col), row by row.
+        """
+        size = self.size
+        box = self.box
+        start = (row // box * box) * size + col // box * box
+        return b"".join(self.cells[start + i * size:start + i * size + box] for i in range(box))
+
+    def empty_count(self):
+        return self.cells.count(0)
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.size:
+            if -self.size <= row < 0:
+                row += self.size
+            else:
+                raise IndexError("row index out of range")
+        return BoardRow(self.cells, row * self.size, self.size)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        size = self.size
+        return (BoardRow(self.cells, r * size, size) for r in range(size))
+
+    def __eq__(self, other):
+        if isinstance(other, Board):
+            return self.cells == other.cells
+        return self.to_rows() == other
+
+    def __hash__(self):
+        # Like any hash of a mutable object, only valid while the board is not changed
+        return hash(bytes(self.cells))
+
+    def __repr__(self):
+        return f"Board({self.to_rows()!r})"
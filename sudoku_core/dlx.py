@@ -0,0 +1,195 @@
+# Dancing Links (Algorithm X) exact-cover engine for counting Sudoku solutions.
+class DLXSolver:
+    """
+    Models a Sudoku grid as an exact cover problem with four constraint
+    families (cell filled, digit in row, digit in column, digit in box),
+    324 columns for a 9x9 grid. Only the constraints left open by the givens
+    and the (cell, digit) rows compatible with them are built, so sparse
+    boards produce a small matrix. Offers the same count_solutions / solve
+    interface as BitmaskSolver.
+    """
+    def __init__(self, board, size=9):
+        self.size = size
+        self.box = int(round(size ** 0.5))
+        self.nodes = 0
+        self.solution = None
+        self.consistent = True
+
+        box = self.box
+        rows_used = [0] * size
+        cols_used = [0] * size
+        boxes_used = [0] * size
+        self.givens = [0] * (size * size)
+        for r in range(size):
+            for c in range(size):
+                num = board[r][c]
+                if num:
+                    bit = 1 << (num - 1)
+                    b = (r // box) * box + c // box
+                    if (rows_used[r] | cols_used[c] | boxes_used[b]) & bit:
+                        self.consistent = False
+                    rows_used[r] |= bit
+                    cols_used[c] |= bit
+                    boxes_used[b] |= bit
+                    self.givens[r * size + c] = num
+
+        # Node 0 is the root header; column headers follow.
+        self.L = [0]
+        self.R = [0]
+        self.U = [0]
+        self.D = [0]
+        self.C = [0]
+        self.S = [0]
+        self.row_of = [None]
+        self.columns = {}
+        self.choices = []
+
+        for r in range(size):
+            for c in range(size):
+                if not self.givens[r * size + c]:
+                    self._add_column(("cell", r, c))
+        for unit, used in (("row", rows_used), ("col", cols_used), ("box", boxes_used)):
+            for i in range(size):
+                for num in range(1, size + 1):
+                    if not used[i] >> (num - 1) & 1:
+                        self._add_column((unit, i, num))
+
+        for r in range(size):
+            for c in range(size):
+                if self.givens[r * size + c]:
+                    continue
+                b = (r // box) * box + c // box
+                free = ~(rows_used[r] | cols_used[c] | boxes_used[b])
+                for num in range(1, size + 1):
+                    if free >> (num - 1) & 1:
+                        self._add_row((r, c, num), [
+                            self.columns[("cell", r, c)],
+                            self.columns[("row", r, num)],
+                            self.columns[("col", c, num)],
+                            self.columns[("box", b, num)],
+                        ])
+
+    def _add_column(self, key):
+        col = len(self.L)
+        self.L.append(self.L[0])
+        self.R.append(0)
+        self.R[self.L[0]] = col
+        self.L[0] = col
+        self.U.append(col)
+        self.D.append(col)
+        self.C.append(col)
+        self.S.append(0)
+        self.row_of.append(None)
+        self.columns[key] = col
+
+    def _add_row(self, choice, cols):
+        first = None
+        for col in cols:
+            node = len(self.L)
+            self.U.append(self.U[col])
+            self.D.append(col)
+            self.D[self.U[col]] = node
+            self.U[col] = node
+            self.C.append(col)
+            self.S.append(0)
+            self.S[col] += 1
+            self.row_of.append(len(self.choices))
+            if first is None:
+                self.L.append(node)
+                self.R.append(node)
+                first = node
+            else:
+                self.L.append(self.L[first])
+                self.R.append(first)
+                self.R[self.L[first]] = node
+                self.L[first] = node
+        self.choices.append(choice)
+
+    def _cover(self, col):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[col]] = R[col]
+        L[R[col]] = L[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, col):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[col]] = col
+        L[R[col]] = col
+
+    def count_solutions(self, limit=2):
+        """
+        Counts exact covers (solutions), stopping once 'limit' is reached.
+        The last solution found is kept in 'solution' as a flat list.
+        """
+        if not self.consistent:
+            return 0
+        return self._search([], 0, limit)
+
+    def solve(self):
+        """
+        Returns a solved copy of the grid as a list of rows, or None if unsolvable.
+        """
+        if self.count_solutions(1) == 0:
+            return None
+        size = self.size
+        return [self.solution[r * size:(r + 1) * size] for r in range(size)]
+
+    def _search(self, picked, found, limit):
+        self.nodes += 1
+        R, D, S = self.R, self.D, self.S
+        if R[0] == 0:
+            solution = self.givens[:]
+            for row in picked:
+                r, c, num = self.choices[row]
+                solution[r * self.size + c] = num
+            self.solution = solution
+            return found + 1
+
+        # Branch on the column with the fewest remaining rows
+        col, best = 0, None
+        j = R[0]
+        while j != 0:
+            if best is None or S[j] < best:
+                col, best = j, S[j]
+                if best <= 1:
+                    break
+            j = R[j]
+        if best == 0:
+            return found
+
+        self._cover(col)
+        i = D[col]
+        while i != col:
+            picked.append(self.row_of[i])
+            j = R[i]
+            while j != i:
+                self._cover(self.C[j])
+                j = R[j]
+            found = self._search(picked, found, limit)
+            j = self.L[i]
+            while j != i:
+                self._uncover(self.C[j])
+                j = self.L[j]
+            picked.pop()
+            if found >= limit:
+                break
+            i = D[i]
+        self._uncover(col)
+        return found
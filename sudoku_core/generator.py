@@ -0,0 +1,647 @@
+import random
+import time
+
+from sudoku_core.board import Board
+from sudoku_core.puzzle import SudokuPuzzle
+from sudoku_core.solver import BitmaskSolver
+
+# Cells removed per difficulty for each board size. Larger boards keep
+# proportionally more clues: greedy digging stops around 70% holes on 9x9,
+# 62% on 16x16 and 57% on 25x25.
+DIFFICULTY_HOLES = {
+    4: {"easy": 6, "medium": 8, "hard": 9, "god": 10},
+    9: {"easy": 40, "medium": 45, "hard": 50, "god": 55},
+    16: {"easy": 120, "medium": 135, "hard": 145, "god": 152},
+    25: {"easy": 280, "medium": 310, "hard": 330, "god": 345},
+}
+
+
+class GenerationStats:
+    """
+    Counters and per-stage timings (seconds) of one generate_puzzle call.
+    'dig_time' includes 'retry_time' and 'check_time'.
+    'check_time' is only measured when the generator is instrumented.
+    """
+    def __init__(self):
+        self.bank_hits = 0       # Puzzles drawn from a PuzzleBank
+        self.grids = 0           # Full grids generated
+        self.grid_restarts = 0   # Full-grid searches abandoned and started over
+        self.grid_nodes = 0      # Search nodes spent building full grids
+        self.retries = 0         # Backtrack-and-retry rounds while digging
+        self.uniqueness_calls = 0  # Uniqueness checks (one per removal attempt)
+        self.solver_nodes = 0    # Search nodes visited by uniqueness checks
+        self.backtracks = 0      # Dead ends hit by uniqueness checks
+        self.rejected = 0        # Removals rejected by the uniqueness check
+        self.timeouts = 0        # Digs abandoned after their time limit
+        self.check_timeouts = 0  # Removals rejected because the check hit its node limit
+        self.rating_score = None  # Score of the accepted puzzle (rating-targeted calls)
+        self.full_grid_time = 0.0
+        self.dig_time = 0.0
+        self.retry_time = 0.0
+        self.check_time = 0.0
+        self.total_time = 0.0
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+class RatingStats:
+    """
+    Online statistics of rating-targeted generation. For every rating band
+    and dig depth (number of holes) it records attempts, successful digs,
+    accepted puzzles and time spent, and for every depth the range of
+    rating scores seen (shared by all bands). Depths are chosen by Thompson
+    sampling of their acceptance rate (Beta(1 + accepted, 1 + rejected)),
+    which minimizes attempts per accepted puzzle: a depth that keeps
+    missing the band is soon left alone, however cheap it is. Depths whose
+    scores, after 'prune_after' rated puzzles, all fall below or above the
+    band are not chosen at all (see reachable_depths).
+    """
+    prune_after = 3
+
+    def __init__(self):
+        self.bands = {}  # band -> {depth: [attempts, dug, accepted, seconds]}
+        self.scores = {}  # depth -> [rated, lowest score, highest score]
+
+    def record(self, band, depth, dug, accepted, seconds, score=None):
+        entry = self.bands.setdefault(tuple(band), {}).setdefault(depth, [0, 0, 0, 0.0])
+        entry[0] += 1
+        entry[1] += dug
+        entry[2] += accepted
+        entry[3] += seconds
+        if score is not None:
+            scores = self.scores.setdefault(depth, [0, score, score])
+            scores[0] += 1
+            scores[1] = min(scores[1], score)
+            scores[2] = max(scores[2], score)
+
+    def reachable_depths(self, band, depths):
+        """
+        Drops the depths that, like every shallower depth, only gave scores
+        below the band, and those that, like every deeper depth, only gave
+        scores above it (scores grow with the number of holes, so a single
+        depth's few scores are not trusted on their own).
+        """
+        reachable = set(depths)
+        highest = None
+        for depth in sorted(depths):
+            rated, _, top = self.scores.get(depth, (0, None, None))
+            if rated:
+                highest = top if highest is None else max(highest, top)
+            if rated >= self.prune_after and highest < band[0]:
+                reachable.discard(depth)
+        lowest = None
+        for depth in sorted(depths, reverse=True):
+            rated, bottom, _ = self.scores.get(depth, (0, None, None))
+            if rated:
+                lowest = bottom if lowest is None else min(lowest, bottom)
+            if rated >= self.prune_after and lowest >= band[1]:
+                reachable.discard(depth)
+        return [depth for depth in depths if depth in reachable] or depths
+
+    def choose_depth(self, band, depths, rng):
+        depth_stats = self.bands.get(tuple(band), {})
+
+        def sampled_rate(depth):
+            attempts, _, accepted, _ = depth_stats.get(depth, (0, 0, 0, 0.0))
+            return rng.betavariate(1 + accepted, 1 + attempts - accepted)
+        return max(self.reachable_depths(band, depths), key=sampled_rate)
+
+    def retry_budget(self, band, depth, retries):
+        """
+        Depths that almost always dig successfully get no retry rounds,
+        the others get the full 'retries' budget.
+        """
+        attempts, dug, _, _ = self.bands.get(tuple(band), {}).get(depth, [0, 0, 0, 0.0])
+        return 0 if (dug + 1) / (attempts + 2) >= 0.9 else retries
+
+    def summary(self):
+        """
+        Per band: attempts, accepted puzzles, acceptance rate, mean latency
+        (seconds per accepted puzzle) and the raw per-depth counters.
+        """
+        result = {}
+        for band, depth_stats in self.bands.items():
+            attempts = sum(entry[0] for entry in depth_stats.values())
+            accepted = sum(entry[2] for entry in depth_stats.values())
+            seconds = sum(entry[3] for entry in depth_stats.values())
+            result[band] = {
+                "attempts": attempts,
+                "accepted": accepted,
+                "acceptance_rate": accepted / attempts if attempts else 0.0,
+                "mean_latency": seconds / accepted if accepted else None,
+                "depths": {depth: list(entry) for depth, entry in sorted(depth_stats.items())},
+            }
+        return result
+
+
+class SudokuGenerator:
+    """
+    Every generation entry point takes an optional 'seed': an int/str seed or
+    a random.Random instance. A seeded call does not depend on earlier calls
+    or on timing, so the same (seed, difficulty) always gives the same puzzle.
+    Unseeded calls use self.rng (itself seeded by the 'seed' argument here).
+
+    Counters in self.stats are always kept (they are summed per dig, not per
+    search node). With 'instrument' every uniqueness check is also timed,
+    and with 'trace' (a writable text file or a path to append to) each
+    stage emits one JSON line: generate, bank_hit, full_grid, dig, timeout
+    and done, with 't' in seconds since the start of the call. The trace is
+    flushed after every "done". A trace file opened from a path belongs to
+    the generator: close() (or leaving a with block) closes it, and a
+    pickled generator reopens it from the path. Caller-owned files are
+    left open.
+    """
+    def __init__(self, size=9, mrv=True, propagation=True, engine="bitmask",
+                 transform=True, symmetric=False, bank=None, seed=None,
+                 instrument=False, trace=None):
+        self.box = int(round(size ** 0.5))
+        if self.box * self.box != size or not 2 <= self.box <= 5:
+            raise ValueError(f"unsupported board size {size} (use 4, 9, 16 or 25)")
+        self.size = size
+        self.rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+        self.bank = bank  # Optional PuzzleBank to draw puzzles from instead of generating
+        self.symmetric = symmetric  # Dig 180-degree symmetric pairs of cells
+        self.transform = transform  # Scramble a cached base grid instead of backtracking
+        self.base_board = None
+        self.engine = engine  # "bitmask" or "dlx" for solution counting
+        self.mrv = mrv
+        self.propagation = propagation  # Naked/hidden singles before backtracking
+        self.solver_nodes = 0  # Search nodes visited by uniqueness checks
+        self.dig_retries = 3  # Backtrack-and-retry rounds before dropping a full grid
+        self.retry_backtrack = 2  # Removals undone per retry round
+        self.dig_time_limit = None  # Seconds before an unseeded dig is abandoned (checks are node-bounded)
+        self.check_node_limit = 150  # Search nodes allowed per removal check, at every size
+        self.stats = GenerationStats()  # Stats of the last generate_puzzle call
+        self.rating_stats = RatingStats()  # Learned across rating-targeted calls
+        self.rating_attempts = 1000  # Full grids tried before giving up on a rating band
+        self.rater = None
+        self.trace_path = trace if isinstance(trace, str) else None
+        if self.trace_path is not None:
+            trace = open(self.trace_path, "a")
+        self.trace = trace
+        self.instrument = instrument or trace is not None
+        self.trace_start = 0.0
+
+    def close(self):
+        """
+        Stops tracing, closing the trace file if it was opened from a path.
+        """
+        if self.trace_path is not None:
+            self.trace.close()
+        self.trace = self.trace_path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.trace_path is not None:
+            state["trace"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.trace_path is not None:
+            self.trace = open(self.trace_path, "a")
+
+    def emit(self, event, **fields):
+        """
+        Writes one trace event as a JSON line (only called when tracing).
+        """
+        import json
+
+        fields["event"] = event
+        fields["t"] = round(time.perf_counter() - self.trace_start, 6)
+        self.trace.write(json.dumps(fields) + "\n")
+        if event == "done":
+            self.trace.flush()
+
+    def get_rng(self, seed=None):
+        """
+        Returns the random.Random to use for 'seed' (self.rng when None).
+        """
+        if seed is None:
+            return self.rng
+        if isinstance(seed, random.Random):
+            return seed
+        return random.Random(seed)
+
+    def generate_puzzle(self, difficulty="Easy", seed=None, rating=None):
+        return self.generate_puzzle_with_solution(difficulty, seed, rating)[0]
+
+    def generate_sudoku(self, difficulty="Easy", seed=None, rating=None):
+        """
+        Returns a SudokuPuzzle that carries its solution.
+        """
+        return SudokuPuzzle(*self.generate_puzzle_with_solution(difficulty, seed, rating))
+
+    def generate_puzzle_with_solution(self, difficulty="Easy", seed=None, rating=None):
+        """
+        Returns (puzzle, solution). Puzzles come from the bank when it holds
+        the difficulty, otherwise they are generated live.
+        With 'rating' = (low, high), the difficulty is ignored and only puzzles
+        whose SudokuRater score is in [low, high) are accepted; the dig depth
+        and retry budget are chosen from self.rating_stats, so seeded calls
+        are only reproducible for the same generator history.
+        """
+        self.stats = stats = GenerationStats()
+        time_i = time.perf_counter()
+        trace = self.trace is not None
+        if trace:
+            self.trace_start = time_i
+            self.emit("generate", difficulty=difficulty, seeded=seed is not None,
+                      rating=list(rating) if rating is not None else None)
+        rng = self.get_rng(seed)
+        if rating is not None and self.rater is None:
+            from sudoku_core.rating import SudokuRater
+            self.rater = SudokuRater(self.size)
+        if (rating is None and self.bank is not None and self.bank.size == self.size
+                and self.bank.count(difficulty.lower())):
+            stats.bank_hits += 1
+            puzzle_and_solution = self.bank.random(difficulty.lower(), rng)
+            stats.total_time = time.perf_counter() - time_i
+            if trace:
+                self.emit("bank_hit")
+                self.emit("done", **stats.as_dict())
+            return puzzle_and_solution
+
+        # A seeded call builds its own base grid instead of the cached one
+        base = None
+        if seed is not None and self.transform:
+            base = self.generate_full_solution(seed=rng)
+        holes = retries = None
+        while True:
+            stage = time.perf_counter()
+            if rating is not None:
+                if stats.grids >= self.rating_attempts:
+                    raise RuntimeError(f"no puzzle rated in {rating} after {stats.grids} attempts")
+                holes = self.rating_stats.choose_depth(rating, self.rating_depths(), rng)
+                retries = self.rating_stats.retry_budget(rating, holes, self.dig_retries)
+                attempt_start = stage
+            if self.transform:
+                full_board = self.generate_transformed_solution(seed=rng, base=base)
+            else:
+                full_board = self.generate_full_solution(seed=rng)
+            stats.grids += 1
+            stats.full_grid_time += time.perf_counter() - stage
+            if trace:
+                self.emit("full_grid", seconds=round(time.perf_counter() - stage, 6),
+                          restarts=stats.grid_restarts, nodes=stats.grid_nodes)
+            if full_board:
+                stage = time.perf_counter()
+                nodes, rejected = stats.solver_nodes, stats.rejected
+                puzzle, check = self.remove_cells_with_unique_check(
+                    full_board.copy(), difficulty, retries=retries, seed=rng,
+                    time_limit=None if seed is not None else self.dig_time_limit, holes=holes)
+                stats.dig_time += time.perf_counter() - stage
+                if trace:
+                    self.emit("dig", holes=holes, unique=check, seconds=round(time.perf_counter() - stage, 6),
+                              nodes=stats.solver_nodes - nodes, rejected=stats.rejected - rejected,
+                              retries=stats.retries)
+                puzzle_rows = puzzle.to_rows()
+                if rating is not None:
+                    dug = check
+                    if dug:
+                        stats.rating_score = self.rater.rate(puzzle_rows).score
+                        check = rating[0] <= stats.rating_score < rating[1]
+                    self.rating_stats.record(rating, holes, dug, check,
+                                             time.perf_counter() - attempt_start,
+                                             stats.rating_score if dug else None)
+                if check:
+                    stats.total_time = time.perf_counter() - time_i
+                    if trace:
+                        self.emit("done", **stats.as_dict())
+                    return puzzle_rows, full_board.to_rows()
+
+    def generate_full_solution(self, board=None, seed=None):
+        """
+        Generates a full valid Sudoku board with the bitmask solver, which
+        scales to 16x16 and 25x25. The diagonal boxes (independent of each
+        other) get random permutations, then the solver completes the grid
+        trying a random digit first in every cell. The rare boxes that cannot
+        be completed, or only after a long search, are drawn again.
+        Returns a Board.
+        """
+        rng = self.get_rng(seed)
+        size = self.size
+        box = self.box
+        while True:
+            board = Board(size=size)
+            for k in range(box):
+                digits = list(range(1, size + 1))
+                rng.shuffle(digits)
+                for i, num in enumerate(digits):
+                    board.set(k * box + i // box, k * box + i % box, num)
+            solver = BitmaskSolver(board, size)
+            solver.prefer = [rng.randint(1, size) for _ in range(size * size)]
+            solver.node_limit = 4 * size * size
+            try:
+                solution = solver.solve()
+            except TimeoutError:
+                solution = None
+            self.stats.grid_nodes += solver.nodes
+            if solution is not None:
+                return Board(solution)
+            self.stats.grid_restarts += 1
+
+    def generate_transformed_solution(self, seed=None, base=None):
+        """
+        Generates a full valid board in constant time by applying a random
+        element of the Sudoku symmetry group to a base grid: digit relabeling,
+        row swaps within bands, band swaps, column swaps within stacks,
+        stack swaps and transposition. Unless 'base' is given, the base grid
+        is built once by generate_full_solution and reused by later calls.
+        Returns a Board.
+        """
+        rng = self.get_rng(seed)
+        if base is None:
+            if self.base_board is None:
+                self.base_board = self.generate_full_solution()
+            base = self.base_board
+        size = self.size
+        box = self.box
+
+        digits = list(range(1, size + 1))
+        rng.shuffle(digits)
+        relabel = [0] + digits
+
+        def line_order():
+            bands = list(range(box))
+            rng.shuffle(bands)
+            order = []
+            for band in bands:
+                lines = [band * box + i for i in range(box)]
+                rng.shuffle(lines)
+                order.extend(lines)
+            return order
+
+        row_order = line_order()
+        col_order = line_order()
+        base_cells = base.cells
+        cells = bytearray(relabel[base_cells[r * size + c]] for r in row_order for c in col_order)
+        if rng.random() < 0.5:
+            cells = b"".join(cells[c::size] for c in range(size))
+        return Board.from_cells(cells)
+
+    def rating_depths(self):
+        """
+        Dig depths (hole counts) tried by rating-targeted generation.
+        """
+        holes = DIFFICULTY_HOLES[self.size]
+        deepest = 2 * holes["god"] - holes["hard"]
+        return list(range(self.size * self.size * 4 // 9, deepest + 1, 2))
+
+    def remove_cells_with_unique_check(self, board, difficulty, retries=None, seed=None,
+                                       time_limit=None, holes=None):
+        """
+        Removes cells from a full board to create a puzzle with a unique solution.
+        Difficulty determines how many cells are removed (DIFFICULTY_HOLES).
+        When a pass cannot
+        reach the target, up to 'retries' rounds (default: self.dig_retries)
+        go back to the deepest state reached, undo a few removals and try
+        other cells before the board is given up. The dig is abandoned after
+        'time_limit' seconds (None, the default, for no limit).
+        'holes' overrides the number of cells removed for the difficulty.
+        'board' is a Board, dug in place, or a list of rows, which is copied
+        and returned as a list of rows.
+        """
+        rows = not isinstance(board, Board)
+        if rows:
+            board = Board(board)
+        if holes is not None:
+            target_removed = holes
+        else:
+            holes_by_difficulty = DIFFICULTY_HOLES[self.size]
+            target_removed = holes_by_difficulty.get(difficulty.lower(), holes_by_difficulty["easy"])
+
+        if retries is None:
+            retries = self.dig_retries
+        size = self.size
+        rng = self.get_rng(seed)
+        deadline = time.time() + time_limit if time_limit is not None else None
+
+        # Each cell (or symmetric pair of cells) is tried once per pass,
+        # in random order.
+        last = size * size - 1
+        if self.symmetric:
+            groups = [(i, last - i) if i != last - i else (i,)
+                      for i in range((size * size + 1) // 2)]
+            if target_removed % 2 == 0:
+                # The centre cell would leave an odd hole count
+                groups = [group for group in groups if len(group) == 2]
+        else:
+            groups = [(i,) for i in range(size * size)]
+        rng.shuffle(groups)
+
+        # The bitmask engine keeps its state across removals instead of
+        # copying and re-solving the board on every attempt.
+        solution = bytes(board.cells)
+        solver = None
+        if self.engine != "dlx":
+            solver = BitmaskSolver(board, size, mrv=self.mrv,
+                                   propagation=self.propagation)
+
+        removed_groups = []  # Accepted removals, in order
+        rejected = []        # (group, accepted removals when it was rejected)
+        untried = []         # Groups a pass stopped before (or skipped as too large)
+        best = ([], [], [])  # Deepest dig state reached: (removed_groups, rejected, untried)
+        pending = groups
+        unique = False
+        for attempt in range(retries + 1):
+            if attempt:
+                # Go back to the deepest state, undo a few more removals each
+                # round and retry the cells that may be removable again.
+                retry_start = time.perf_counter()
+                self.stats.retries += 1
+                self._set_removed(board, solver, solution, removed_groups, best[0])
+                rejected = best[1][:]
+                untried = []
+                keep = max(0, len(removed_groups) - self.retry_backtrack * attempt)
+                undone = removed_groups[keep:]
+                self._set_removed(board, solver, solution, removed_groups, removed_groups[:keep])
+                pending = [group for group, depth in rejected if depth >= keep] + best[2]
+                rejected = [(group, depth) for group, depth in rejected if depth < keep]
+                rng.shuffle(pending)
+                pending += undone
+
+            outcome = self._dig_pass(board, solver, solution, pending, removed_groups,
+                                     rejected, untried, target_removed, deadline)
+            if attempt:
+                self.stats.retry_time += time.perf_counter() - retry_start
+            if outcome:
+                unique = True
+                break
+            if len(removed_groups) > len(best[0]):
+                best = (removed_groups[:], rejected[:], untried[:])
+            if outcome is None:
+                break
+
+        if solver is not None:
+            self.stats.backtracks += solver.backtracks
+        return (board.to_rows() if rows else board), unique
+
+    def _dig_pass(self, board, solver, solution, pending, removed_groups, rejected,
+                  untried, target_removed, deadline):
+        """
+        Tries to remove each group in 'pending' once, recording accepted and
+        rejected groups, and in 'untried' the groups not tried (too large for
+        the holes left, or not reached when the pass stops early). Returns
+        True when the target is reached, False when it can no longer be
+        reached and None on timeout.
+        """
+        cells = board.cells
+        removed = sum(len(group) for group in removed_groups)
+        remaining = sum(len(group) for group in pending)
+        for i, group in enumerate(pending):
+            if removed >= target_removed:
+                break
+            remaining -= len(group)
+            if removed + len(group) > target_removed:
+                untried.append(group)
+            else:
+                for idx in group:
+                    cells[idx] = 0
+                if solver is None:
+                    unique = self.solve_sudoku_check_uniqueness(board) == 1
+                else:
+                    unique = self.check_removal(solver, group, solution, cells)
+
+                if unique:
+                    removed += len(group)
+                    removed_groups.append(group)
+                else:
+                    self.stats.rejected += 1
+                    rejected.append((group, len(removed_groups)))
+                    for idx in group:
+                        cells[idx] = solution[idx]
+
+            # Report early once the target can no longer be reached
+            if removed + remaining < target_removed:
+                untried.extend(pending[i + 1:])
+                return False
+            if deadline is not None and time.time() > deadline:
+                self.stats.timeouts += 1
+                if self.trace is not None:
+                    self.emit("timeout", removed=removed, target=target_removed)
+                return None
+
+        return removed >= target_removed
+
+    def _set_removed(self, board, solver, solution, removed_groups, wanted):
+        """
+        Moves the dig state to the (known unique) one where exactly the groups
+        in 'wanted' are removed. No uniqueness check is needed.
+        """
+        cells = board.cells
+        wanted_set = set(wanted)
+        for group in removed_groups:
+            if group not in wanted_set:
+                for idx in group:
+                    cells[idx] = solution[idx]
+                    if solver is not None:
+                        solver.place(idx, solution[idx])
+        current = set(removed_groups)
+        for group in wanted:
+            if group not in current:
+                for idx in group:
+                    cells[idx] = 0
+                    if solver is not None:
+                        solver.unplace(idx)
+        removed_groups[:] = wanted
+
+    def check_removal(self, solver, cells, solution, puzzle=None):
+        """
+        Removes the clues at 'cells' from a solver that holds the current
+        (unique) puzzle and checks that the puzzle stays unique. Since
+        'solution' is known, the puzzle stays unique exactly when no solution
+        has a different digit at one of those cells, so only that is searched
+        for. A clue that is still forced by the remaining ones needs no search.
+        A search longer than check_node_limit nodes counts as a rejection,
+        which is always safe; the solver is then reloaded from 'puzzle' (the
+        flat puzzle with 'cells' already cleared), or from a snapshot taken
+        here when it is not given. The clues are put back if the removal is
+        rejected.
+        """
+        if self.instrument:
+            check_start = time.perf_counter()
+        before = puzzle if puzzle is not None else solver.cells[:]
+        for idx in cells:
+            solver.unplace(idx)
+        nodes = solver.nodes
+        solver.node_limit = nodes + self.check_node_limit
+        unique = True
+        try:
+            for idx in cells:
+                if solver.is_forced(idx, solution[idx]):
+                    continue
+                if solver.has_alternative(idx, solution[idx], prefer=solution):
+                    unique = False
+                    break
+        except TimeoutError:
+            self.stats.check_timeouts += 1
+            solver.load(before)
+            unique = False
+        solver.node_limit = None
+        self.solver_nodes += solver.nodes - nodes
+        stats = self.stats
+        stats.uniqueness_calls += 1
+        stats.solver_nodes += solver.nodes - nodes
+        if not unique:
+            for idx in cells:
+                if not solver.cells[idx]:
+                    solver.place(idx, solution[idx])
+        if self.instrument:
+            stats.check_time += time.perf_counter() - check_start
+        return unique
+
+    def solve_sudoku_check_uniqueness(self, board, found=0):
+        """
+        Counts solutions (up to 2) with the selected engine.
+        Returns:
+          0 = no solution,
+          1 = unique solution,
+          2 = more than one solution.
+        """
+        if found > 1:
+            return 2
+        if self.engine == "dlx":
+            from sudoku_core.dlx import DLXSolver
+            solver = DLXSolver(board, self.size)
+        else:
+            solver = BitmaskSolver(board, self.size, mrv=self.mrv,
+                                   propagation=self.propagation)
+        count = solver.count_solutions(2 - found)
+        self.solver_nodes += solver.nodes
+        self.stats.uniqueness_calls += 1
+        self.stats.solver_nodes += solver.nodes
+        self.stats.backtracks += getattr(solver, "backtracks", 0)
+        return found + count
+
+    def check_uniqueness_dual_order(self, board, time_budget=0.05):
+        """
+        Quick uniqueness test with the same 0/1/2 contract as
+        solve_sudoku_check_uniqueness. The puzzle is solved once trying digits
+        in ascending order and once in descending order; both searches walk
+        the same tree from opposite ends, so they meet on the same grid
+        exactly when the solution is unique. Falls back to counting solutions
+        if the searches take longer than 'time_budget' seconds.
+        """
+        deadline = time.perf_counter() + time_budget
+        try:
+            solutions = []
+            for descending in (False, True):
+                solver = BitmaskSolver(board, self.size, mrv=self.mrv,
+                                       propagation=self.propagation,
+                                       descending=descending)
+                solver.deadline = deadline
+                solutions.append(solver.solve())
+                self.solver_nodes += solver.nodes
+                if solutions[0] is None:
+                    return 0
+        except TimeoutError:
+            return self.solve_sudoku_check_uniqueness(board)
+        return 1 if solutions[0] == solutions[1] else 2
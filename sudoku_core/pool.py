@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import deque
+
+from sudoku_core.generator import SudokuGenerator
+
+
+# Pool of pre-generated puzzles so the UI thread never waits for the generator.
+class PuzzlePool:
+    """
+    Keeps up to 'capacity' ready puzzles per difficulty. Once a difficulty
+    drops below 'low_water', a worker thread tops every difficulty back up,
+    emptiest first, sleeping 'pause' seconds between puzzles so it leaves
+    time to the UI.
+    get() pops a puzzle in O(1) and only generates synchronously when the
+    pool for that difficulty is empty. With 'bank', both the worker and
+    the fallback draw the difficulties it holds from the bank.
+    Puzzles are SudokuPuzzle objects that carry their solution.
+    """
+    def __init__(self, difficulties=("easy", "medium", "hard", "god"),
+                 capacity=3, low_water=1, pause=0.0, bank=None):
+        self.capacity = capacity
+        self.low_water = low_water
+        self.pause = pause
+        self.puzzles = {difficulty: deque() for difficulty in difficulties}
+        self.hits = {difficulty: 0 for difficulty in difficulties}
+        self.misses = {difficulty: 0 for difficulty in difficulties}
+        self.generated = 0  # Puzzles produced by the worker thread
+        self.bank = bank
+        self.generator = SudokuGenerator(bank=bank)  # Used for synchronous fallbacks
+        self.wakeup = threading.Event()
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        """
+        Starts the refill thread (a daemon, so it never blocks app exit).
+        """
+        if self.thread is not None:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._refill_loop, name="puzzle-pool", daemon=True)
+        self.thread.start()
+        self.wakeup.set()
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def get(self, difficulty):
+        """
+        Returns a puzzle for 'difficulty', from the pool when one is ready.
+        """
+        puzzles = self.puzzles.get(difficulty)
+        try:
+            puzzle = puzzles.popleft()
+        except (AttributeError, IndexError):
+            self.misses[difficulty] = self.misses.get(difficulty, 0) + 1
+            puzzle = self.generator.generate_sudoku(difficulty)
+        else:
+            self.hits[difficulty] += 1
+        if puzzles is not None and len(puzzles) < self.low_water:
+            self.wakeup.set()
+        return puzzle
+
+    def metrics(self):
+        """
+        Returns hit/miss counts and current pool sizes per difficulty.
+        """
+        return {
+            difficulty: {
+                "ready": len(puzzles),
+                "hits": self.hits[difficulty],
+                "misses": self.misses.get(difficulty, 0),
+            }
+            for difficulty, puzzles in self.puzzles.items()
+        }
+
+    def _refill_loop(self):
+        # Its own generator (and random state), drawing from the same bank
+        generator = SudokuGenerator(bank=self.bank)
+        while self.running:
+            # Woken up when a difficulty drops below the low-water mark,
+            # then fills every difficulty up to capacity, emptiest first.
+            difficulty, puzzles = min(self.puzzles.items(), key=lambda item: len(item[1]))
+            if len(puzzles) >= self.capacity:
+                self.wakeup.wait()
+                self.wakeup.clear()
+                continue
+            puzzles.append(generator.generate_sudoku(difficulty))
+            self.generated += 1
+            if self.pause:
+                time.sleep(self.pause)
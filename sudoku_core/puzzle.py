@@ -0,0 +1,132 @@
+from sudoku_core.board import Board
+from sudoku_core.solver import ConstraintGrid
+
+
+# Class to hold the Sudoku board and provide move validation.
+class SudokuPuzzle(ConstraintGrid):
+    """
+    Works with any N²xN² board (4x4, 9x9, 16x16, 25x25); the size is taken
+    from the board itself. The board is kept as a Board, which still reads
+    like a list of rows (board[row][col]).
+
+    The row, column and box masks of ConstraintGrid (the same model the
+    generator's solver uses) are kept up to date by set_cell/clear_cell, so
+    move validation, conflict queries and the completion check are O(1).
+    A player may enter a digit twice in a unit, so each unit also counts
+    its digits; 'conflicts' is the number of extra copies on the board.
+    Cells must be changed through set_cell/clear_cell, not through the board.
+
+    With the 'solution' (as returned by the generator), the puzzle also
+    counts the cells that hold their solution digit, so per-cell checks,
+    reveal_cell and is_solved are O(1) and never need a solver.
+    """
+    def __init__(self, board, solution=None):
+        self.board = board if isinstance(board, Board) else Board(board)
+        size = self.board.size
+        self.solution = None
+        if solution is not None:
+            self.solution = solution if isinstance(solution, Board) else Board(solution)
+        self.unit_counts = [[0] * (size + 1) for _ in range(3 * size)]
+        self.conflicts = 0
+        self.filled = 0
+        self.correct = 0  # Cells holding their solution digit
+        super().__init__(self.board, size)
+        # Same digits; from now on the masks and the board share one buffer
+        self.cells = self.board.cells
+
+    def place(self, idx, num):
+        size = self.size
+        for unit in (self.cell_row[idx], size + self.cell_col[idx], 2 * size + self.cell_box[idx]):
+            counts = self.unit_counts[unit]
+            counts[num] += 1
+            if counts[num] > 1:
+                self.conflicts += 1
+        self.filled += 1
+        if self.solution is not None and self.solution.cells[idx] == num:
+            self.correct += 1
+        super().place(idx, num)
+
+    def unplace(self, idx):
+        size = self.size
+        num = self.cells[idx]
+        super().unplace(idx)
+        self.filled -= 1
+        if self.solution is not None and self.solution.cells[idx] == num:
+            self.correct -= 1
+        bit = 1 << (num - 1)
+        row, col, box = self.cell_row[idx], self.cell_col[idx], self.cell_box[idx]
+        for unit, masks, i in ((row, self.rows, row), (size + col, self.cols, col),
+                               (2 * size + box, self.boxes, box)):
+            counts = self.unit_counts[unit]
+            counts[num] -= 1
+            if counts[num]:
+                # Another copy of the digit is still in the unit
+                self.conflicts -= 1
+                masks[i] |= bit
+
+    def set_cell(self, row, col, value):
+        """
+        Writes 'value' at (row, col); 0 clears the cell.
+        """
+        idx = row * self.size + col
+        if self.cells[idx]:
+            self.unplace(idx)
+        if value:
+            self.place(idx, value)
+
+    def clear_cell(self, row, col):
+        self.set_cell(row, col, 0)
+
+    def is_valid_move(self, board, row, col, value):
+        """
+        Checks if placing the given value in the board at (row, col) is valid.
+        """
+        if board is not self.board:
+            other = SudokuPuzzle(board)
+            return other.is_valid_move(other.board, row, col, value)
+        return bool(self.candidates(row * self.size + col) >> (value - 1) & 1)
+
+    def has_conflict(self, row, col):
+        """
+        True if the digit at (row, col) also appears elsewhere in its row,
+        column or box.
+        """
+        idx = row * self.size + col
+        num = self.cells[idx]
+        if not num:
+            return False
+        size = self.size
+        return (self.unit_counts[self.cell_row[idx]][num] > 1
+                or self.unit_counts[size + self.cell_col[idx]][num] > 1
+                or self.unit_counts[2 * size + self.cell_box[idx]][num] > 1)
+
+    def is_complete(self):
+        """
+        True when every cell is filled and no digit repeats in a unit, i.e.
+        the board is a correct solution.
+        """
+        return self.filled == self.size * self.size and not self.conflicts
+
+    def is_correct(self, row, col):
+        """
+        True if (row, col) holds its solution digit. Needs the solution.
+        """
+        idx = row * self.size + col
+        return self.cells[idx] == self.solution.cells[idx]
+
+    def reveal_cell(self, row, col):
+        """
+        Writes the solution digit at (row, col) and returns it. Needs the solution.
+        """
+        value = self.solution.cells[row * self.size + col]
+        self.set_cell(row, col, value)
+        return value
+
+    def is_solved(self):
+        """
+        True when the board equals the solution (without a solution: when
+        it is complete and correct).
+        """
+        if self.solution is None:
+            return self.is_complete()
+        return self.correct == self.size * self.size
@@ -0,0 +1,342 @@
+from itertools import combinations
+
+from sudoku_core.solver import BitmaskSolver
+
+# Techniques from easiest to hardest, with the score added each time one is applied.
+TECHNIQUES = [
+    ("naked_single", 1),
+    ("hidden_single", 2),
+    ("pointing", 5),
+    ("claiming", 5),
+    ("naked_pair", 6),
+    ("hidden_pair", 8),
+    ("naked_triple", 10),
+    ("hidden_triple", 12),
+    ("x_wing", 20),
+    ("swordfish", 30),
+    ("coloring", 40),
+    ("backtracking", 100),
+]
+TECHNIQUE_SCORES = dict(TECHNIQUES)
+TECHNIQUE_LEVELS = {name: level for level, (name, _) in enumerate(TECHNIQUES)}
+
+
+class Rating:
+    """
+    Result of rating a puzzle: the hardest technique needed ('technique',
+    with its 'level' in TECHNIQUES), a numeric 'score' (the sum of the
+    scores of every technique application) and how often each technique
+    was applied ('steps'). 'solved' is False for puzzles without a solution.
+    """
+    def __init__(self, technique, score, steps, solved=True):
+        self.technique = technique
+        self.level = TECHNIQUE_LEVELS.get(technique, -1)
+        self.score = score
+        self.steps = steps
+        self.solved = solved
+
+    def as_dict(self):
+        return dict(vars(self))
+
+    def __repr__(self):
+        return f"Rating({self.technique!r}, score={self.score})"
+
+
+# Rates puzzles by solving them step by step the way a human would.
+class SudokuRater:
+    """
+    Keeps candidates as bitmasks (bit num - 1) and applies the easiest
+    technique that makes progress, starting over from singles after each
+    step. A puzzle that no technique can finish is rated "backtracking".
+    The unit and peer tables are built once and shared by every rate() call.
+    """
+    def __init__(self, size=9):
+        self.size = size
+        self.box = int(round(size ** 0.5))
+        self.all_digits = (1 << size) - 1
+        cells = size * size
+        box = self.box
+        self.rows = [[r * size + c for c in range(size)] for r in range(size)]
+        self.cols = [[r * size + c for r in range(size)] for c in range(size)]
+        self.boxes = [[(b // box * box + i // box) * size + b % box * box + i % box
+                       for i in range(size)] for b in range(size)]
+        self.units = self.rows + self.cols + self.boxes
+        self.cell_box = [(i // size) // box * box + (i % size) // box for i in range(cells)]
+        self.peers = [set() for _ in range(cells)]
+        for unit in self.units:
+            for idx in unit:
+                self.peers[idx].update(unit)
+        for idx in range(cells):
+            self.peers[idx].discard(idx)
+        self.peer_lists = [list(peers) for peers in self.peers]
+        self.strategies = [
+            ("naked_single", self.naked_singles),
+            ("hidden_single", self.hidden_singles),
+            ("pointing", self.pointing),
+            ("claiming", self.claiming),
+            ("naked_pair", lambda: self.naked_subsets(2)),
+            ("hidden_pair", lambda: self.hidden_subsets(2)),
+            ("naked_triple", lambda: self.naked_subsets(3)),
+            ("hidden_triple", lambda: self.hidden_subsets(3)),
+            ("x_wing", lambda: self.fish(2)),
+            ("swordfish", lambda: self.fish(3)),
+            ("coloring", self.coloring),
+        ]
+
+    def rate(self, board):
+        """
+        Rates a puzzle given as a list of rows (0 = empty cell).
+        """
+        size = self.size
+        self.values = [num for row in board for num in row]
+        self.cand = [0 if num else self.all_digits for num in self.values]
+        self.contradiction = False
+        for idx, num in enumerate(self.values):
+            if num:
+                bit = 1 << (num - 1)
+                for peer in self.peer_lists[idx]:
+                    if self.values[peer] == num:
+                        return Rating(None, 0, {}, solved=False)
+                    self.cand[peer] &= ~bit
+
+        steps = {}
+        hardest = None
+        score = 0
+        while 0 in self.values:
+            for name, strategy in self.strategies:
+                if strategy():
+                    break
+            else:
+                name = "backtracking"
+            if self.contradiction:
+                return Rating(hardest, score, steps, solved=False)
+            steps[name] = steps.get(name, 0) + 1
+            score += TECHNIQUE_SCORES[name]
+            if hardest is None or TECHNIQUE_LEVELS[name] > TECHNIQUE_LEVELS[hardest]:
+                hardest = name
+            if name == "backtracking":
+                grid = [self.values[r * size:(r + 1) * size] for r in range(size)]
+                solved = BitmaskSolver(grid, size).solve() is not None
+                return Rating(hardest, score, steps, solved=solved)
+        return Rating(hardest, score, steps)
+
+    def place(self, idx, num):
+        bit = 1 << (num - 1)
+        self.values[idx] = num
+        self.cand[idx] = 0
+        cand = self.cand
+        for peer in self.peer_lists[idx]:
+            cand[peer] &= ~bit
+
+    def eliminate(self, cells, mask):
+        """
+        Removes the digits in 'mask' from 'cells'. Returns True if anything changed.
+        """
+        changed = False
+        cand = self.cand
+        for idx in cells:
+            if cand[idx] & mask:
+                cand[idx] &= ~mask
+                changed = True
+                if not cand[idx] and not self.values[idx]:
+                    self.contradiction = True
+        return changed
+
+    def naked_singles(self):
+        placed = False
+        cand = self.cand
+        for idx, free in enumerate(cand):
+            if free and not free & (free - 1):
+                self.place(idx, free.bit_length())
+                placed = True
+            elif not free and not self.values[idx]:
+                self.contradiction = True
+                return True
+        return placed
+
+    def hidden_singles(self):
+        placed = False
+        cand = self.cand
+        for unit in self.units:
+            once = twice = 0
+            for idx in unit:
+                twice |= once & cand[idx]
+                once |= cand[idx]
+            singles = once & ~twice
+            if singles:
+                for idx in unit:
+                    free = cand[idx] & singles
+                    if free:
+                        if free & (free - 1):
+                            # Two digits that can only go into the same cell
+                            self.contradiction = True
+                            return True
+                        self.place(idx, free.bit_length())
+                        placed = True
+        return placed
+
+    def pointing(self):
+        """
+        A digit confined to one row (or column) inside a box is removed
+        from the rest of that row (or column).
+        """
+        size = self.size
+        changed = False
+        for box_cells in self.boxes:
+            for d in range(size):
+                bit = 1 << d
+                cells = [idx for idx in box_cells if self.cand[idx] & bit]
+                if len(cells) < 2:
+                    continue
+                rows = {idx // size for idx in cells}
+                cols = {idx % size for idx in cells}
+                if len(rows) == 1:
+                    line = self.rows[rows.pop()]
+                elif len(cols) == 1:
+                    line = self.cols[cols.pop()]
+                else:
+                    continue
+                if self.eliminate([idx for idx in line if idx not in cells], bit):
+                    changed = True
+        return changed
+
+    def claiming(self):
+        """
+        A digit confined to one box inside a row (or column) is removed
+        from the rest of that box.
+        """
+        size = self.size
+        changed = False
+        for line in self.rows + self.cols:
+            for d in range(size):
+                bit = 1 << d
+                cells = [idx for idx in line if self.cand[idx] & bit]
+                if len(cells) < 2:
+                    continue
+                boxes = {self.cell_box[idx] for idx in cells}
+                if len(boxes) == 1:
+                    box_cells = self.boxes[boxes.pop()]
+                    if self.eliminate([idx for idx in box_cells if idx not in cells], bit):
+                        changed = True
+        return changed
+
+    def naked_subsets(self, n):
+        """
+        n cells of a unit whose candidates together are exactly n digits:
+        those digits are removed from the other cells of the unit.
+        """
+        cand = self.cand
+        for unit in self.units:
+            cells = [idx for idx in unit if cand[idx] and cand[idx].bit_count() <= n]
+            if len(cells) < n:
+                continue
+            for group in combinations(cells, n):
+                mask = 0
+                for idx in group:
+                    mask |= cand[idx]
+                if mask.bit_count() == n:
+                    if self.eliminate([idx for idx in unit if idx not in group], mask):
+                        return True
+        return False
+
+    def hidden_subsets(self, n):
+        """
+        n digits of a unit that only fit in the same n cells: every other
+        candidate is removed from those cells.
+        """
+        cand = self.cand
+        for unit in self.units:
+            places = {}
+            for d in range(self.size):
+                bit = 1 << d
+                cells = [idx for idx in unit if cand[idx] & bit]
+                if 2 <= len(cells) <= n:
+                    places[bit] = cells
+            if len(places) < n:
+                continue
+            for digits in combinations(places, n):
+                cells = set()
+                for bit in digits:
+                    cells.update(places[bit])
+                if len(cells) == n:
+                    keep = sum(digits)
+                    if self.eliminate(cells, self.all_digits & ~keep):
+                        return True
+        return False
+
+    def fish(self, n):
+        """
+        X-Wing (n = 2) and Swordfish (n = 3): a digit confined to the same n
+        columns within n rows is removed from those columns in other rows,
+        and the same with rows and columns swapped.
+        """
+        size = self.size
+        cand = self.cand
+        for d in range(size):
+            bit = 1 << d
+            for base, cover in ((self.rows, self.cols), (self.cols, self.rows)):
+                lines = {}
+                for i, line in enumerate(base):
+                    positions = [j for j, idx in enumerate(line) if cand[idx] & bit]
+                    if 2 <= len(positions) <= n:
+                        lines[i] = positions
+                if len(lines) < n:
+                    continue
+                for group in combinations(lines, n):
+                    positions = set()
+                    for i in group:
+                        positions.update(lines[i])
+                    if len(positions) != n:
+                        continue
+                    targets = [cover[j][i] for j in positions for i in range(size) if i not in group]
+                    if self.eliminate(targets, bit):
+                        return True
+        return False
+
+    def coloring(self):
+        """
+        Simple coloring: cells linked by conjugate pairs (the only two places
+        for a digit in a unit) alternate between true and false. A color that
+        appears twice in one unit is false; a cell that sees both colors
+        cannot hold the digit.
+        """
+        cand = self.cand
+        for d in range(self.size):
+            bit = 1 << d
+            links = {}
+            for unit in self.units:
+                cells = [idx for idx in unit if cand[idx] & bit]
+                if len(cells) == 2:
+                    a, b = cells
+                    links.setdefault(a, set()).add(b)
+                    links.setdefault(b, set()).add(a)
+
+            colored = {}
+            for start in links:
+                if start in colored:
+                    continue
+                colors = ([], [])
+                colored[start] = 0
+                stack = [start]
+                while stack:
+                    idx = stack.pop()
+                    colors[colored[idx]].append(idx)
+                    for other in links[idx]:
+                        if other not in colored:
+                            colored[other] = 1 - colored[idx]
+                            stack.append(other)
+                if len(colors[0]) + len(colors[1]) < 4:
+                    continue
+
+                for color in colors:
+                    if any(b in self.peers[a] for a, b in combinations(color, 2)):
+                        if self.eliminate(color, bit):
+                            return True
+                chain = set(colors[0]) | set(colors[1])
+                targets = [idx for idx in range(len(cand))
+                           if cand[idx] & bit and idx not in chain
+                           and any(c in self.peers[idx] for c in colors[0])
+                           and any(c in self.peers[idx] for c in colors[1])]
+                if self.eliminate(targets, bit):
+                    return True
+        return False
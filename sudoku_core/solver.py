@@ -0,0 +1,288 @@
+import time
+
+
+# Row, column and box occupancy of a grid, shared by the solver and the game's puzzle model.
+class ConstraintGrid:
+    """
+    Keeps row, column and box occupancy as integer bitmasks.
+    Bit (num - 1) of a mask is set when 'num' is already used in that unit,
+    so the candidates of a cell are a single AND/NOT of three masks.
+    Cells are flat indices (row * size + col). The index tables only depend
+    on the size and are built once per size.
+    """
+    _tables = {}
+
+    def __init__(self, board, size=9):
+        self.size = size
+        self.box = int(round(size ** 0.5))
+        self.all_digits = (1 << size) - 1
+        if size not in ConstraintGrid._tables:
+            ConstraintGrid._tables[size] = self._build_tables(size, self.box)
+        self.cell_row, self.cell_col, self.cell_box, self.units = ConstraintGrid._tables[size]
+        self.rows = [0] * size
+        self.cols = [0] * size
+        self.boxes = [0] * size
+        self.cells = [0] * (size * size)
+        self.consistent = True
+
+        for r in range(size):
+            for c in range(size):
+                num = board[r][c]
+                if num:
+                    idx = r * size + c
+                    if not self.candidates(idx) >> (num - 1) & 1:
+                        self.consistent = False
+                    self.place(idx, num)
+
+    @staticmethod
+    def _build_tables(size, box):
+        cell_row = [i // size for i in range(size * size)]
+        cell_col = [i % size for i in range(size * size)]
+        cell_box = [(r // box) * box + c // box for r, c in zip(cell_row, cell_col)]
+        units = ([[r * size + c for c in range(size)] for r in range(size)]
+                 + [[r * size + c for r in range(size)] for c in range(size)]
+                 + [[i for i in range(size * size) if cell_box[i] == b] for b in range(size)])
+        return cell_row, cell_col, cell_box, units
+
+    def load(self, cells):
+        """
+        Resets the grid to the flat list 'cells', e.g. after a search was
+        interrupted by its budget and left cells placed.
+        """
+        size = self.size
+        self.rows = [0] * size
+        self.cols = [0] * size
+        self.boxes = [0] * size
+        self.cells = [0] * (size * size)
+        for idx, num in enumerate(cells):
+            if num:
+                self.place(idx, num)
+
+    def place(self, idx, num):
+        """
+        Writes 'num' into cell 'idx' and marks it as used in its row, column and box.
+        """
+        bit = 1 << (num - 1)
+        self.cells[idx] = num
+        self.rows[self.cell_row[idx]] |= bit
+        self.cols[self.cell_col[idx]] |= bit
+        self.boxes[self.cell_box[idx]] |= bit
+
+    def unplace(self, idx):
+        """
+        Clears cell 'idx' and releases its digit in the row, column and box masks.
+        """
+        mask = ~(1 << (self.cells[idx] - 1))
+        self.cells[idx] = 0
+        self.rows[self.cell_row[idx]] &= mask
+        self.cols[self.cell_col[idx]] &= mask
+        self.boxes[self.cell_box[idx]] &= mask
+
+    def candidates(self, idx):
+        """
+        Returns the bitmask of digits that can legally go into cell 'idx'.
+        """
+        return self.all_digits & ~(self.rows[self.cell_row[idx]]
+                                   | self.cols[self.cell_col[idx]]
+                                   | self.boxes[self.cell_box[idx]])
+
+
+# Bitmask constraint engine used by the generator to count solutions.
+class BitmaskSolver(ConstraintGrid):
+    """
+    Searches for solutions on top of the ConstraintGrid masks.
+    With 'mrv' the search branches on the empty cell with the fewest
+    candidates; 'nodes' and 'backtracks' count the work done by the search.
+    With 'propagation' naked and hidden singles are filled in before any
+    branching, so easy grids are usually solved without search.
+    With 'descending' digits are tried from high to low, which visits the
+    same search tree in mirrored order.
+    """
+    def __init__(self, board, size=9, mrv=True, propagation=True, descending=False):
+        self.mrv = mrv
+        self.propagation = propagation
+        self.descending = descending
+        self.deadline = None  # perf_counter() value after which the search raises TimeoutError
+        self.node_limit = None  # Node count after which the search raises TimeoutError
+        self.nodes = 0
+        self.backtracks = 0
+        self.propagated = 0
+        self.solution = None
+        self.prefer = None  # Flat grid whose digits are tried first when branching
+        super().__init__(board, size)
+
+    def is_forced(self, idx, num):
+        """
+        Returns True if 'num' is the only candidate of the empty cell 'idx', or
+        the only place left for 'num' in one of the units containing 'idx'.
+        """
+        bit = 1 << (num - 1)
+        if self.candidates(idx) == bit:
+            return True
+        size = self.size
+        for unit in (self.units[self.cell_row[idx]],
+                     self.units[size + self.cell_col[idx]],
+                     self.units[2 * size + self.cell_box[idx]]):
+            for other in unit:
+                if other != idx and not self.cells[other] and self.candidates(other) & bit:
+                    break
+            else:
+                return True
+        return False
+
+    def propagate(self):
+        """
+        Repeatedly fills naked singles and hidden singles (per row, column and box).
+        Returns the list of filled cells so they can be undone with unplace,
+        or None if a contradiction was found (the grid is left untouched).
+        """
+        cells = self.cells
+        trail = []
+        changed = True
+        while changed:
+            changed = False
+            # Naked singles: cells with exactly one candidate
+            for idx in range(len(cells)):
+                if cells[idx]:
+                    continue
+                free = self.candidates(idx)
+                if not free:
+                    return self._undo(trail)
+                if not free & (free - 1):
+                    self.place(idx, free.bit_length())
+                    trail.append(idx)
+                    changed = True
+            # Hidden singles: digits with exactly one place left in a unit
+            for unit in self.units:
+                used = once = twice = 0
+                for idx in unit:
+                    if cells[idx]:
+                        used |= 1 << (cells[idx] - 1)
+                    else:
+                        free = self.candidates(idx)
+                        twice |= once & free
+                        once |= free
+                if (used | once) != self.all_digits:
+                    return self._undo(trail)
+                singles = once & ~twice
+                if not singles:
+                    continue
+                for idx in unit:
+                    if cells[idx]:
+                        continue
+                    free = self.candidates(idx) & singles
+                    if free:
+                        if free & (free - 1):
+                            return self._undo(trail)
+                        self.place(idx, free.bit_length())
+                        trail.append(idx)
+                        changed = True
+        self.propagated += len(trail)
+        return trail
+
+    def _undo(self, trail):
+        for idx in reversed(trail):
+            self.unplace(idx)
+        return None
+
+    def select_cell(self, empties, pos):
+        """
+        Returns the position in empties[pos:] of the cell with the fewest candidates.
+        Stops scanning as soon as a cell with zero or one candidate is found.
+        """
+        best, best_count = pos, self.size + 1
+        for i in range(pos, len(empties)):
+            count = self.candidates(empties[i]).bit_count()
+            if count < best_count:
+                best, best_count = i, count
+                if count <= 1:
+                    break
+        return best
+
+    def count_solutions(self, limit=2):
+        """
+        Counts solutions of the current grid, stopping once 'limit' is reached.
+        The last solution found is kept in 'solution' as a flat list.
+        """
+        if not self.consistent:
+            return 0
+        trail = []
+        if self.propagation:
+            trail = self.propagate()
+            if trail is None:
+                return 0
+        empties = [i for i, num in enumerate(self.cells) if num == 0]
+        found = self._count(empties, 0, 0, limit)
+        self._undo(trail)
+        return found
+
+    def solve(self):
+        """
+        Returns a solved copy of the grid as a list of rows, or None if unsolvable.
+        """
+        if self.count_solutions(1) == 0:
+            return None
+        size = self.size
+        return [self.solution[r * size:(r + 1) * size] for r in range(size)]
+
+    def has_alternative(self, idx, num, prefer=None):
+        """
+        Returns True if the grid has a solution with a digit other than 'num'
+        in the empty cell 'idx'. Stops at the first such solution. 'prefer'
+        (e.g. the known full solution, as a flat list) orders the branching.
+        """
+        others = self.candidates(idx) & ~(1 << (num - 1))
+        self.prefer = prefer
+        try:
+            while others:
+                bit = others & -others
+                others ^= bit
+                self.place(idx, bit.bit_length())
+                found = self.count_solutions(1)
+                self.unplace(idx)
+                if found:
+                    return True
+            return False
+        finally:
+            self.prefer = None
+
+    def _count(self, empties, pos, found, limit):
+        self.nodes += 1
+        # The node limit is exact; the clock is only read every 256 nodes
+        if ((self.node_limit is not None and self.nodes > self.node_limit)
+                or (not self.nodes & 255 and self.deadline is not None
+                    and time.perf_counter() > self.deadline)):
+            raise TimeoutError("search budget exceeded")
+        if pos == len(empties):
+            self.solution = self.cells[:]
+            return found + 1
+        best = pos
+        if self.mrv:
+            # Swapped back before returning, so the branching order only
+            # depends on the grid and not on previously explored siblings.
+            best = self.select_cell(empties, pos)
+            empties[pos], empties[best] = empties[best], empties[pos]
+        idx = empties[pos]
+        free = self.candidates(idx)
+        if not free:
+            self.backtracks += 1
+        first = 0
+        if self.prefer is not None:
+            first = free & (1 << (self.prefer[idx] - 1))
+            free ^= first
+        while first or free:
+            if first:
+                bit, first = first, 0
+            elif self.descending:
+                bit = 1 << (free.bit_length() - 1)
+                free ^= bit
+            else:
+                bit = free & -free
+                free ^= bit
+            self.place(idx, bit.bit_length())
+            found = self._count(empties, pos + 1, found, limit)
+            self.unplace(idx)
+            if found >= limit:
+                break
+        empties[pos], empties[best] = empties[best], empties[pos]
+        return found
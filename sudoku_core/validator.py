@@ -0,0 +1,126 @@
+"""
+Vectorized validation of many boards at once (needs NumPy).
+
+Boards are stacked into an (N, size, size) uint8 array. Each cell is mapped
+to its digit bit (bit num - 1, 0 for an empty cell) through a lookup table,
+and all rows, columns and boxes are reduced together: a unit is
+duplicate-free when the sum of its bits equals their OR, and complete when
+the sum has every digit bit set.
+"""
+import numpy as np
+
+from sudoku_core.bank import bits_per_cell, record_size
+
+# Result flags returned per board by validate_batch()
+CLUES_CONSISTENT = 1   # puzzle digits in range and no digit repeated in a unit
+SOLUTION_VALID = 2     # solution is a complete, correct grid
+CLUES_MATCH = 4        # every clue equals the solution digit in that cell
+VALID = CLUES_CONSISTENT | SOLUTION_VALID | CLUES_MATCH
+
+
+def as_boards(boards):
+    """
+    Returns 'boards' (an array or a list of boards given as lists of rows)
+    as an (N, size, size) uint8 array.
+    """
+    boards = np.asarray(boards, dtype=np.uint8)
+    if boards.ndim == 2:
+        boards = boards[np.newaxis]
+    if boards.ndim != 3 or boards.shape[1] != boards.shape[2]:
+        raise ValueError(f"expected an (N, size, size) array, got shape {boards.shape}")
+    return boards
+
+
+def unit_bits(boards):
+    """
+    Returns (bits, in_range): the digit bit of every cell grouped by unit,
+    shape (N, 3 * size, size), and whether all digits of each board are <= size.
+    """
+    n, size, _ = boards.shape
+    box = int(round(size ** 0.5))
+    dtype = np.uint16 if size <= 9 else np.uint32
+    table = np.zeros(256, dtype=dtype)
+    table[1:size + 1] = 1 << np.arange(size, dtype=dtype)
+    bits = table[boards]
+    boxes = (bits.reshape(n, box, box, box, box)
+             .transpose(0, 1, 3, 2, 4)
+             .reshape(n, size, size))
+    units = np.concatenate((bits, bits.transpose(0, 2, 1), boxes), axis=1)
+    in_range = (boards <= size).all(axis=(1, 2))
+    return units, in_range
+
+
+def check_grids(boards):
+    """
+    True for each board that is a complete and correct solution grid.
+    """
+    boards = as_boards(boards)
+    size = boards.shape[1]
+    units, in_range = unit_bits(boards)
+    # size powers of two only add up to all digit bits when they are distinct
+    full = units.sum(axis=2, dtype=units.dtype) == (1 << size) - 1
+    return in_range & full.all(axis=1)
+
+
+def check_clues(boards):
+    """
+    True for each board (0 = empty cell) whose digits do not repeat in any
+    row, column or box. Says nothing about whether the puzzle is solvable.
+    """
+    boards = as_boards(boards)
+    units, in_range = unit_bits(boards)
+    distinct = units.sum(axis=2, dtype=units.dtype) == np.bitwise_or.reduce(units, axis=2)
+    return in_range & distinct.all(axis=1)
+
+
+def check_matches(puzzles, solutions):
+    """
+    True for each puzzle whose clues all equal the digits of its solution.
+    """
+    puzzles = as_boards(puzzles)
+    solutions = as_boards(solutions)
+    if puzzles.shape != solutions.shape:
+        raise ValueError(f"{puzzles.shape[0]} puzzles but {solutions.shape[0]} solutions")
+    return ((puzzles == 0) | (puzzles == solutions)).all(axis=(1, 2))
+
+
+def validate_batch(puzzles, solutions=None):
+    """
+    Validates puzzles, and their stored solutions when given. Returns a
+    uint8 array with the result flags of each board; a board passed every
+    check when its flags equal VALID (CLUES_CONSISTENT without solutions).
+    """
+    puzzles = as_boards(puzzles)
+    result = np.where(check_clues(puzzles), CLUES_CONSISTENT, 0).astype(np.uint8)
+    if solutions is not None:
+        solutions = as_boards(solutions)
+        result |= np.where(check_grids(solutions), SOLUTION_VALID, 0).astype(np.uint8)
+        result |= np.where(check_matches(puzzles, solutions), CLUES_MATCH, 0).astype(np.uint8)
+    return result
+
+
+def decode_records(data, size=9):
+    """
+    Decodes concatenated puzzle bank records (sudoku_core.bank.encode_record)
+    into (puzzles, solutions) arrays without a per-record Python loop.
+    """
+    bits = bits_per_cell(size)
+    cells = size * size
+    split = (cells * bits + 7) // 8
+    records = np.frombuffer(data, dtype=np.uint8).reshape(-1, record_size(size))
+    packed = np.unpackbits(records[:, :split], axis=1, bitorder="little")
+    packed = packed[:, :cells * bits].reshape(-1, cells, bits)
+    solutions = (packed << np.arange(bits, dtype=np.uint8)).sum(axis=2, dtype=np.uint8)
+    clues = np.unpackbits(records[:, split:], axis=1, bitorder="little")[:, :cells]
+    puzzles = solutions * clues
+    return puzzles.reshape(-1, size, size), solutions.reshape(-1, size, size)
+
+
+def validate_bank(bank, difficulty):
+    """
+    Validates every record of one difficulty of an open PuzzleBank and
+    returns the result flags per record.
+    """
+    offset, records = bank.sections[difficulty]
+    data = bank.data[offset:offset + records * bank.record_size]
+    return validate_batch(*decode_records(data, bank.size))
@@ -17,8 +17,10 @@ class SudokuGrid(GridLayout):
     def __init__(self, sudoku_puzzle, **kwargs):
         super().__init__(**kwargs)
         self.sudoku_puzzle = sudoku_puzzle
-        self.cols = 9
-        self.rows = 9
+        self.board_size = len(sudoku_puzzle.board)  # 4, 9, 16 or 25
+        self.box = int(round(self.board_size ** 0.5))
+        self.cols = self.board_size
+        self.rows = self.board_size
         self.cells = []
         self.selected_number = None
         self.scale_factor=1
@@ -26,9 +28,9 @@ class SudokuGrid(GridLayout):
 
         self.update_size(1)  # Llamar a update_size al inicio para calcular el tamaño inicial
 
-        for i in range(9):
+        for i in range(self.board_size):
             row_cells = []
-            for j in range(9):
+            for j in range(self.board_size):
                 value = sudoku_puzzle.board[i][j]
                 cell = SudokuCell(
                     text=str(value) if value != 0 else "",
@@ -55,7 +57,7 @@ class SudokuGrid(GridLayout):
         grid_size = screen_width * grid_prop
         self.size = (grid_size, grid_size)
         self.pos = self.pos # ((screen_width - grid_size) / 2, screen_height * 0.4)
-        self.cell_size = grid_size / 9  # Tamaño de celda ajustado
+        self.cell_size = grid_size / self.board_size  # Tamaño de celda ajustado
         for row in self.cells:
             for cell in row:
                 cell.font_size = self.cell_size / 1  # Ajustar tamaño de fuente
@@ -92,20 +94,20 @@ class SudokuGrid(GridLayout):
         self.canvas.after.clear()
         with self.canvas.after:
             Color(1, 1, 1, 1)
-            cell_size = self.size[0] / 9
+            cell_size = self.size[0] / self.board_size
 
             # Dibujar líneas verticales
-            for i in range(10):
-                line_width = 2.5 if i % 3 == 0 else 1
+            for i in range(self.board_size + 1):
+                line_width = 2.5 if i % self.box == 0 else 1
                 Line(points=[self.x + i * cell_size, self.y, self.x + i * cell_size, self.y + self.size[1]], width=line_width)
 
             # Dibujar líneas horizontales
-            for j in range(10):
-                line_width = 2.5 if j % 3 == 0 else 1
+            for j in range(self.board_size + 1):
+                line_width = 2.5 if j % self.box == 0 else 1
                 Line(points=[self.x, self.y + j * cell_size, self.x + self.size[0], self.y + j * cell_size], width=line_width)
 
 
-# Number pad widget with 9 buttons for selecting a number.
+# Number pad widget with one button per number (plus erase) for selecting a number.
 class NumberPad(BoxLayout):
     def __init__(self, sudoku_grid, **kwargs):
         super().__init__(**kwargs)
@@ -117,9 +119,10 @@ class NumberPad(BoxLayout):
         # self.update_size(1) 
         pad_width = sudoku_grid.size[0]
         pad_height = pad_width/7
-        self.btn_size = pad_width / 11 
+        numbers = sudoku_grid.board_size
+        self.btn_size = pad_width / (numbers + 2)
         
-        for i in range(0, 10):
+        for i in range(0, numbers + 1):
             text_i = str(i) if i > 0 else "<"
             btn = Button(
                 text=text_i,